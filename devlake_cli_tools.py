@@ -1,19 +1,41 @@
 
     import sys
     import math
+    import re
     import os
-    import random
     import time
-    import json
-    import shutil
     import zipfile
     from pathlib import Path
     from textwrap import dedent
+    import numpy as np
     import polars as pl
     import duckdb # For ConsoleRunner's LocalExecutor
-    from typing import Union, Dict, Any, List
+    from typing import Union, Dict, Any, List, Final, Optional, Tuple
 
-    from .devlake_executors import LocalExecutor
+    from .devlake_executors import get_local_executor
+    from .devlake_pipeline import generate_pipeline_hash
+
+    # Shared generator for mock data so seeding happens once per process.
+    _RNG = np.random.default_rng()
+
+    _PREVIEW_ROWS = 5
+    _LIMIT_RE = re.compile(r"\blimit\b", re.IGNORECASE)
+
+
+    def _preview_queries(command: str) -> Optional[Tuple[str, str]]:
+        """
+        Rewrites a bare single-statement SELECT into (sample, count) queries so the
+        console never materializes a full result just to print its head.
+        Returns None when the command should be executed as-is.
+        """
+        statement = command.rstrip().rstrip(';')
+        if statement[:6].casefold() != 'select' or ';' in statement or _LIMIT_RE.search(statement):
+            return None
+        # The newline ends any trailing `--` comment before the closing parenthesis.
+        return (
+            f"SELECT * FROM ({statement}\n) t LIMIT {_PREVIEW_ROWS}",
+            f"SELECT COUNT(*) FROM ({statement}\n) t",
+        )
 
 
     class ConsoleRunner:
@@ -22,7 +44,7 @@
         Provides a REPL interface for SQL against the embedded DuckDB instance.
         """
         def __init__(self, project_name: str):
-            self.executor = LocalExecutor(data_dir=Path(project_name) / ".devlake/data")
+            self.executor = get_local_executor(project_name)
             print("
 --- Starting DevLake Console ---")
             print("💡 Available tables are registered during pipeline runs (e.g., 'airports', 'country_counts').")
@@ -32,18 +54,27 @@
             while True:
                 try:
                     command = input("devlake (sql)> ").strip()
-                    if command.lower() == 'exit':
+                    # Only the first few characters decide dispatch; avoid copying multi-KB pasted SQL.
+                    head = command[:8].casefold()
+                    if head == 'exit':
                         print("Exiting console. Goodbye!")
                         break
                     if not command:
                         continue
 
-                    if command.lower().startswith('select') or command.lower().startswith('show'):
-                        result_df = self.executor.query(command)
+                    if head.startswith(('select', 'show')):
+                        preview = _preview_queries(command)
+                        if preview:
+                            sample_sql, count_sql = preview
+                            result_df = self.executor.query_prepared(sample_sql)
+                            total_rows = self.executor.query_prepared(count_sql).item()
+                        else:
+                            result_df = self.executor.query_prepared(command)
+                            total_rows = len(result_df)
                         print("
 --- Query Result (Polars DataFrame) ---")
-                        print(result_df.head(5))
-                        print(f"Total rows: {len(result_df)}
+                        print(result_df.head(_PREVIEW_ROWS))
+                        print(f"Total rows: {total_rows}
 ")
                     else:
                         print("Console only supports SQL SELECT/SHOW commands for now.")
@@ -85,6 +116,13 @@
                 }
             }
 
+            # Column-wise copies of the models so a whole report is two vector ops.
+            self._target_index = {target: i for i, target in enumerate(self.models)}
+            self._names = np.array([m["name"] for m in self.models.values()])
+            self._t_step = np.array([m["time_factor_steps"] for m in self.models.values()])
+            self._t_data = np.array([m["time_factor_data"] for m in self.models.values()])
+            self._rate = np.array([m["cost_rate"] for m in self.models.values()])
+
         def estimate(self, target: str) -> Dict[str, Union[float, str]]:
             model = self.models.get(target)
             if not model:
@@ -106,28 +144,27 @@
             print(f"Complexity: {self.num_steps} Steps, {self.data_size_gb} GB Data
 ")
 
-            results = []
             all_targets = ['local'] + cloud_targets
-            for target in all_targets:
-                results.append(self.estimate(target))
-
-            min_cost = min(r['cost'] for r in results)
+            idx = np.array([self._target_index[target] for target in all_targets])
+            times = self._t_step[idx] * self.num_steps + self._t_data[idx] * self.data_size_gb
+            costs = times * self._rate[idx]
+            min_cost = costs.min()
 
             print(f"{'Target':<20} | {'Time (min)':<12} | {'Cost (USD)':<12} | {'Recommendation'}")
             print("-" * 60)
 
             recommendation_target = ""
-            for result in results:
-                time_str = f"{result['time_min']:.2f}"
-                cost_str = f"${result['cost']:.2f}"
-                is_cheapest = result['cost'] == min_cost
+            for name, time_min, cost in zip(self._names[idx], times, costs):
+                time_str = f"{time_min:.2f}"
+                cost_str = f"${cost:.2f}"
+                is_cheapest = cost == min_cost
                 rec = ""
-                if result['target'] == "Local execution":
+                if name == "Local execution":
                     rec = "Baseline (Free & Fast Cold Start)"
                 elif is_cheapest:
                     rec = "CHEAPEST OPTION"
-                    recommendation_target = result['target']
-                print(f"{result['target']:<20} | {time_str:<12} | {cost_str:<12} | {rec}")
+                    recommendation_target = name
+                print(f"{name:<20} | {time_str:<12} | {cost_str:<12} | {rec}")
 
             if recommendation_target:
                  print(f"
@@ -145,17 +182,19 @@ Recommendation: Use **{recommendation_target}** for the most cost-effective run.
                 {"id": "dl-1003", "name": "dashboard_prep", "target": "gcp", "status": "RUNNING", "runtime": "2m 3s"},
                 {"id": "dl-1004", "name": "experiment_branch", "target": "local", "status": "PENDING", "runtime": "-"},
             ]
+            # Dicts keep insertion order, so this serves both ordered listing and O(1) lookup.
+            self._jobs_by_id = {job['id']: job for job in self.jobs}
 
         def monitor(self):
             print("
 --- 📊 DevLake Monitor (REQ-019) ---")
             print(f"{'ID':<10} | {'Pipeline':<20} | {'Target':<10} | {'Status':<10} | {'Runtime'}")
             print("-" * 65)
-            for job in self.jobs:
+            for job in self._jobs_by_id.values():
                 print(f"{job['id']:<10} | {job['name']:<20} | {job['target']:<10} | {job['status']:<10} | {job['runtime']}")
 
         def debug_job(self, job_id: str):
-            job = next((j for j in self.jobs if j['id'] == job_id), None)
+            job = self._jobs_by_id.get(job_id)
             if job is None:
                 print(f"❌ Error: Job ID {job_id} not found.")
                 return
@@ -194,42 +233,31 @@ Job completed successfully. No major issues detected.")
             self.package_name = f"devlake-share-{self.branch}-{int(time.time())}.zip"
             self.package_path = self.output_dir / self.package_name
 
-        def _create_sample_data_folder(self, temp_dir: Path):
+        def _add_sample_data(self, zf: zipfile.ZipFile):
             """Mocks sampling the current branch's data for portability."""
-            sample_data_path = temp_dir / ".devlake/data" / self.branch
-            sample_data_path.mkdir(parents=True, exist_ok=True)
-
             branch_data_path = self.project_path / ".devlake/data" / self.branch
             duckdb_file = branch_data_path / "devlake.duckdb"
 
             if duckdb_file.exists():
-                shutil.copy(duckdb_file, sample_data_path / "devlake.duckdb")
+                zf.write(duckdb_file, f".devlake/data/{self.branch}/devlake.duckdb")
                 print(f"  -> Included data snapshot for branch **{self.branch}**.")
             else:
                 print("  -> WARNING: No persistent DuckDB file found to sample. Sharing code only.")
 
         def create_package(self):
-            temp_dir = Path(f"devlake_staging_temp_{random.randint(100, 999)}")
-            if temp_dir.exists(): shutil.rmtree(temp_dir)
-            temp_dir.mkdir()
+            # Stream straight into the archive; staging a copy doubles disk I/O for large DuckDB files.
+            with zipfile.ZipFile(self.package_path, 'w', compression=zipfile.ZIP_DEFLATED,
+                                 compresslevel=1, allowZip64=True) as zf:
+                zf.write(self.project_path / "devlake.yaml", "devlake.yaml")
 
-            shutil.copy(self.project_path / "devlake.yaml", temp_dir / "devlake.yaml")
-            shutil.copytree(self.project_path / "pipelines", temp_dir / "pipelines")
+                for root, _, files in os.walk(self.project_path / "pipelines"):
+                    for file_name in files:
+                        file_path = Path(root) / file_name
+                        zf.write(file_path, file_path.relative_to(self.project_path).as_posix())
 
-            self._create_sample_data_folder(temp_dir)
-
-            zip_base_name = str(self.package_path).rsplit('.', 1)[0]
-            shutil.make_archive(
-                base_name=zip_base_name,
-                format='zip',
-                root_dir=temp_dir
-            )
+                self._add_sample_data(zf)
 
-            final_path = self.output_dir / self.package_name
-            os.rename(str(zip_base_name) + ".zip", final_path)
-
-            shutil.rmtree(temp_dir)
-            return final_path
+            return self.package_path
 
         def generate_share_url(self, package_path: Path) -> str:
             unique_id = package_path.name.replace('.zip', '').split('-')[-1]
@@ -247,6 +275,55 @@ Job completed successfully. No major issues detected.")
             return mock_url
 
 
+    # Registry YAML is dedented and encoded once at import rather than per client.
+    _REGISTRY: Final[Dict[str, Dict[str, Any]]] = {
+        "pipeline/transform_github_data": {
+            "version": "v1.2.0",
+            "yaml_content": dedent("""
+                # pipeline/transform_github_data.yaml
+                name: github_transform_v1
+                version: 1
+                triggers:
+                  - schedule: "0 0 * * *"
+                inputs:
+                  - type: git
+                    repo: ${{ input.repo_url }}
+                    branch: main
+                transformations:
+                  - sql: |
+                      SELECT
+                        author_email,
+                        COUNT(DISTINCT commit_hash) as commit_count
+                      FROM github_commits
+                      GROUP BY 1
+                      HAVING commit_count > 5
+                    output_alias: top_contributors
+                output:
+                  type: delta
+                  path: ./data/processed/github_metrics
+            """).encode('utf-8')
+        },
+        "pipeline/s3_to_parquet": {
+            "version": "v0.9.1",
+            "yaml_content": dedent("""
+                # pipeline/s3_to_parquet.yaml
+                name: s3_ingestion
+                version: 1
+                inputs:
+                  - type: s3
+                    uri: s3://${{ input.bucket }}/${{ input.prefix }}
+                    format: csv
+                transformations:
+                  - python: |
+                      transformed_df = df.filter(pl.col("is_valid") == True)
+                output:
+                  type: parquet
+                  path: ./data/raw/clean_output
+            """).encode('utf-8')
+        }
+    }
+
+
     class MarketplaceClient:
         """
         Mocks the interaction with the public registry for `devlake import` (REQ-022).
@@ -255,52 +332,7 @@ Job completed successfully. No major issues detected.")
             self.project_name = project_name
             self.pipelines_path = Path(project_name) / "pipelines"
 
-            self.registry = {
-                "pipeline/transform_github_data": {
-                    "version": "v1.2.0",
-                    "yaml_content": dedent("""
-                        # pipeline/transform_github_data.yaml
-                        name: github_transform_v1
-                        version: 1
-                        triggers:
-                          - schedule: "0 0 * * *"
-                        inputs:
-                          - type: git
-                            repo: ${{ input.repo_url }}
-                            branch: main
-                        transformations:
-                          - sql: |
-                              SELECT
-                                author_email,
-                                COUNT(DISTINCT commit_hash) as commit_count
-                              FROM github_commits
-                              GROUP BY 1
-                              HAVING commit_count > 5
-                            output_alias: top_contributors
-                        output:
-                          type: delta
-                          path: ./data/processed/github_metrics
-                    """)
-                },
-                "pipeline/s3_to_parquet": {
-                    "version": "v0.9.1",
-                    "yaml_content": dedent("""
-                        # pipeline/s3_to_parquet.yaml
-                        name: s3_ingestion
-                        version: 1
-                        inputs:
-                          - type: s3
-                            uri: s3://${{ input.bucket }}/${{ input.prefix }}
-                            format: csv
-                        transformations:
-                          - python: |
-                              transformed_df = df.filter(pl.col("is_valid") == True)
-                        output:
-                          type: parquet
-                          path: ./data/raw/clean_output
-                    """)
-                }
-            }
+            self.registry = _REGISTRY
 
         def import_pipeline(self, registry_path: str):
             print(f"
@@ -319,7 +351,7 @@ Job completed successfully. No major issues detected.")
                  return
 
             try:
-                target_path.write_text(pipeline_info['yaml_content'])
+                target_path.write_bytes(pipeline_info['yaml_content'])
                 print(f"✅ Successfully imported '{registry_path}' (Version: {pipeline_info['version']}).")
                 print(f"File saved to: **{target_path}**")
                 print("
@@ -339,20 +371,49 @@ Next step: Review the YAML and run with `devlake run`.")
             self.benchmark_dir = Path(project_name) / ".devlake/benchmarks"
             self.benchmark_dir.mkdir(parents=True, exist_ok=True)
             self.pipeline_name = pipeline_config['name']
+            self.pipeline_hash = generate_pipeline_hash(pipeline_config)
+            # Append-only history of (pipeline_hash, step_key, runtime_s, ts) rows.
+            self.baseline_file = self.benchmark_dir / f"{self.pipeline_name}_baseline.parquet"
 
         def _get_baseline_runtime(self) -> Dict[str, float]:
-            baseline_file = self.benchmark_dir / f"{self.pipeline_name}_baseline.json"
-            if baseline_file.exists():
-                with open(baseline_file, 'r') as f:
-                    return json.load(f)
-            else:
-                return {
-                    "step_1_load": 5.0,
-                    "step_2_transform": 15.0,
-                    "step_3_save": 8.0
-                }
+            if self.baseline_file.exists():
+                latest = (
+                    pl.scan_parquet(self.baseline_file)
+                    .filter(pl.col("pipeline_hash") == self.pipeline_hash)
+                    .group_by("step_key")
+                    .agg(pl.col("runtime_s").sort_by("ts").last())
+                    .collect()
+                )
+                if len(latest):
+                    return dict(latest.iter_rows())
+            return {
+                "step_1_load": 5.0,
+                "step_2_transform": 15.0,
+                "step_3_save": 8.0
+            }
 
-        def run_benchmark(self):
+        def _record_baseline(self, runtimes: Dict[str, float]):
+            """Appends this run's step runtimes to the baseline history."""
+            now = time.time()
+            rows = pl.DataFrame(
+                {
+                    "pipeline_hash": [self.pipeline_hash] * len(runtimes),
+                    "step_key": list(runtimes),
+                    "runtime_s": list(runtimes.values()),
+                    "ts": [now] * len(runtimes),
+                },
+                schema={"pipeline_hash": pl.Utf8, "step_key": pl.Utf8, "runtime_s": pl.Float64, "ts": pl.Float64},
+            )
+            if self.baseline_file.exists():
+                rows = pl.concat([pl.read_parquet(self.baseline_file), rows])
+
+            # Parquet has no in-place append; rewrite to a temp file and swap it in atomically.
+            tmp_file = self.baseline_file.with_name(self.baseline_file.name + ".tmp")
+            rows.write_parquet(tmp_file, compression="zstd")
+            os.replace(tmp_file, self.baseline_file)
+
+        def run_benchmark(self, seed: Optional[int] = None):
+            """Simulates a benchmark run; pass seed to reproduce a run's noise exactly."""
             baseline = self._get_baseline_runtime()
             current_runtimes = {}
             total_regression = 0.0
@@ -360,11 +421,17 @@ Next step: Review the YAML and run with `devlake run`.")
             print(f"
 --- ⏱️ Benchmarking Pipeline: {self.pipeline_name} (REQ-011) ---")
 
-            for i, step_def in enumerate(self.pipeline_config['steps']):
-                step_key = f"step_{i+1}_{list(step_def.keys())[0]}"
+            steps = self.pipeline_config['steps']
+            # Draw all per-step noise up front. Each run needs fresh noise: the result becomes the
+            # next baseline, so a fixed seed would compound the same factors run after run.
+            rng = np.random.default_rng(seed)
+            jitter = rng.uniform(0.9, 1.1, size=len(steps))
+            slowdown = np.where(rng.random(len(steps)) < 0.2, 1.15, 1.0)
+
+            for i, step_def in enumerate(steps):
+                step_key = f"step_{i+1}_{next(iter(step_def))}"
                 base_time = baseline.get(step_key, 10.0)
-                slowdown_factor = 1.0 + (0.15 * (1 if random.random() < 0.2 else 0))
-                current_time = base_time * random.uniform(0.9, 1.1) * slowdown_factor
+                current_time = float(base_time * jitter[i] * slowdown[i])
                 current_runtimes[step_key] = current_time
 
                 regression_ms = (current_time - base_time) * 1000
@@ -381,9 +448,8 @@ Next step: Review the YAML and run with `devlake run`.")
             else:
                 print("✅ Benchmark passed. No significant performance regression detected.")
 
-            with open(self.benchmark_dir / f"{self.pipeline_name}_baseline.json", 'w') as f:
-                json.dump(current_runtimes, f)
-                print("  New baseline recorded.")
+            self._record_baseline(current_runtimes)
+            print("  New baseline recorded.")
 
 
     class StorageClient:
@@ -404,10 +470,9 @@ Next step: Review the YAML and run with `devlake run`.")
             if filters:
                 print(f"  Optimization 2: **Push-down Filters** - Applying filter '{filters}' at source.")
 
-            mock_data = {
-                col: random.sample(range(1000, 9999), 5) for col in (columns if columns else ["id", "default_col"])
-            }
-            return pl.LazyFrame(mock_data)
+            mock_columns = columns if columns else ["id", "default_col"]
+            values = _RNG.integers(1000, 9999, size=(len(mock_columns), 5), dtype=np.int32)
+            return pl.LazyFrame({col: values[i] for i, col in enumerate(mock_columns)})
 
         def write_optimized(self, df: pl.DataFrame, path: str, format: str):
             print(f"
@@ -1,12 +1,23 @@
 
+    import os
+    import re
+    import asyncio
+    import threading
+    import atexit
     import duckdb
     import polars as pl
     from pathlib import Path
-    from typing import Union, Dict, Any, List
+    from collections import OrderedDict
+    from typing import Union, Dict, Any, List, Optional, Sequence, Tuple
     import time
     import random
     from textwrap import dedent
 
+    # Statements that can change the catalog and therefore invalidate the cached schema.
+    _DDL_RE = re.compile(r"^\s*(CREATE|DROP|ALTER)\b", re.IGNORECASE)
+    # Bound relations kept per executor; the least recently used is dropped beyond this.
+    _PLAN_CACHE_SIZE = 64
+
     class LocalExecutor:
         """Core local execution engine using DuckDB (SQL) and Polars (DataFrames), supporting branching."""
         def __init__(self, data_dir: Union[str, Path] = ".devlake/data", branch: str = "main"):
@@ -16,17 +27,54 @@
             db_path = branch_dir / "devlake.duckdb"
 
             self.duckdb = duckdb.connect(database=str(db_path))
-            self.data_store: Dict[str, pl.DataFrame] = {} # Polars data cache for save/polars ops
+            self.data_store: Dict[str, pl.LazyFrame] = {} # Lazy Polars handles for save/polars ops; nothing is materialized here
+            self._catalog_version = 0
+            self._catalog_cache: Optional[Tuple[int, Dict[str, Dict[str, str]]]] = None
+            # Bound relations for repeated SQL text; valid only for the catalog version they were bound against.
+            self._plan_cache: "OrderedDict[str, duckdb.DuckDBPyRelation]" = OrderedDict()
+            self._plan_cache_version = 0
+            # Polars SQL context for one pipeline run; frames are bound as they are registered rather than per query.
+            self._sql_ctx = pl.SQLContext()
+            # Pipelines sharing this executor share its aliases, so their steps must not interleave.
+            self.run_lock = threading.Lock()
             print(f"✅ LocalExecutor initialized. Branch: **{self.branch}**. Database: {db_path}")
 
-        def register_dataframe(self, name: str, df: pl.DataFrame):
-            """Registers a Polars DataFrame as a virtual table in DuckDB."""
-            self.duckdb.register(name, df.to_arrow())
-            self.data_store[name] = df
-            print(f"  -> Registered table **{name}** ({len(df)} rows).")
+        def register_dataframe(self, name: str, df: Union[pl.DataFrame, pl.LazyFrame]):
+            """
+            Registers a Polars frame under name. The data store always holds a LazyFrame; only
+            in-memory DataFrames are also exposed to DuckDB, since a LazyFrame would have to be
+            materialized for DuckDB to scan it.
+            """
+            self.data_store[name] = df.lazy()
+            self._sql_ctx.register(name, df)
+            if isinstance(df, pl.DataFrame):
+                # DuckDB scans Polars frames through the Arrow C stream interface, so no to_arrow() copy is needed.
+                self.duckdb.register(name, df)
+                self._catalog_version += 1
+                print(f"  -> Registered table **{name}** ({len(df)} rows).")
+            else:
+                print(f"  -> Registered lazy table **{name}**.")
+
+        def reset_frames(self):
+            """
+            Starts a new pipeline run: forgets the Polars frames (and SQL aliases) registered by
+            earlier runs, so a run can only see tables it loads itself.
+            """
+            self.data_store = {}
+            self._sql_ctx = pl.SQLContext()
+
+        def query_lazy(self, sql: str) -> pl.LazyFrame:
+            """Plans SQL over the registered Polars frames; nothing executes until the result is collected or sunk."""
+            try:
+                return self._sql_ctx.execute(sql, eager=False)
+            except Exception as e:
+                print(f"  -> ERROR planning query: {e}")
+                raise
 
         def query(self, sql: str) -> pl.DataFrame:
             """Executes SQL and returns the result as a Polars DataFrame."""
+            if _DDL_RE.match(sql):
+                self._catalog_version += 1
             try:
                 arrow_table = self.duckdb.execute(sql).fetch_arrow_table()
                 df_result = pl.from_arrow(arrow_table)
@@ -35,35 +83,115 @@
                 print(f"  -> ERROR executing query: {e}")
                 raise
 
+        def query_prepared(self, sql: str, params: Sequence[Any] = ()) -> pl.DataFrame:
+            """
+            Like query(), but reuses the bound DuckDB relation when the same SQL text is run again,
+            skipping parse and bind for repeated interactive queries.
+            """
+            if _DDL_RE.match(sql):
+                return self.query(sql)
+
+            if self._plan_cache_version != self._catalog_version:
+                self._plan_cache.clear()
+                self._plan_cache_version = self._catalog_version
+            try:
+                if params:
+                    # Relations cannot take parameters; execute() binds them to a prepared statement.
+                    return pl.from_arrow(self.duckdb.execute(sql, params).fetch_arrow_table())
+                relation = self._plan_cache.get(sql)
+                if relation is None:
+                    relation = self.duckdb.sql(sql)
+                    if relation is None:  # Statement produced no result set.
+                        return pl.DataFrame()
+                    self._plan_cache[sql] = relation
+                    if len(self._plan_cache) > _PLAN_CACHE_SIZE:
+                        self._plan_cache.popitem(last=False)
+                else:
+                    self._plan_cache.move_to_end(sql)
+                return pl.from_arrow(relation.arrow())
+            except Exception as e:
+                print(f"  -> ERROR executing query: {e}")
+                raise
+
         def get_catalog_schema(self) -> Dict[str, Dict[str, str]]:
             """
             Retrieves the catalog and schema information (REQ-008, REQ-018).
             Used by the CLI for auto-completion and the VS Code extension for IntelliSense.
             """
-            schema = {}
-            tables_query = self.duckdb.execute("SHOW TABLES;").fetch_df()['name'].tolist()
+            if self._catalog_cache and self._catalog_cache[0] == self._catalog_version:
+                return self._catalog_cache[1]
 
-            for table_name in tables_query:
-                try:
-                    table_schema = self.duckdb.execute(f"PRAGMA table_info('{table_name}')").fetch_df()
-                    columns = {row['name']: row['type'] for index, row in table_schema.iterrows()}
-                    schema[table_name] = columns
-                except Exception:
-                    continue
+            # One information_schema scan instead of SHOW TABLES plus a PRAGMA per table.
+            columns = self.duckdb.execute(
+                "SELECT table_name, column_name, data_type FROM information_schema.columns "
+                "WHERE table_schema = 'main' ORDER BY table_name, ordinal_position"
+            ).fetch_arrow_table()
+            grouped = (
+                pl.from_arrow(columns)
+                .group_by("table_name", maintain_order=True)
+                .agg(pl.col("column_name"), pl.col("data_type"))
+            )
+            schema = {
+                table_name: dict(zip(column_names, data_types))
+                for table_name, column_names, data_types in grouped.iter_rows()
+            }
+            self._catalog_cache = (self._catalog_version, schema)
             return schema
 
         def close(self):
             self.duckdb.close()
+            with _EXECUTORS_LOCK:
+                for key, executor in list(_EXECUTORS.items()):
+                    if executor is self:
+                        del _EXECUTORS[key]
             print(f"**LocalExecutor** shut down for branch '{self.branch}'.")
 
 
+    # Process-wide executors keyed by (data_dir, branch). Reopening the DuckDB file reloads the
+    # catalog and starts with a cold buffer pool, so CLI commands share one connection instead.
+    _EXECUTORS: Dict[Tuple[str, str], LocalExecutor] = {}
+    # Guards _EXECUTORS so concurrent runs on a fresh project agree on a single executor.
+    _EXECUTORS_LOCK = threading.Lock()
+
+
+    def _executor_key(project_name: str, branch: str) -> Tuple[str, str]:
+        return (str((Path(project_name) / ".devlake/data").resolve()), branch)
+
+
+    def get_local_executor(project_name: str, branch: str = "main") -> LocalExecutor:
+        """Returns the shared LocalExecutor for a project branch, creating it on first use."""
+        key = _executor_key(project_name, branch)
+        with _EXECUTORS_LOCK:
+            executor = _EXECUTORS.get(key)
+            if executor is None:
+                executor = LocalExecutor(data_dir=Path(project_name) / ".devlake/data", branch=branch)
+                _EXECUTORS[key] = executor
+        return executor
+
+
+    def close_local_executor(project_name: str, branch: str = "main"):
+        """Closes the shared LocalExecutor for a project branch, if one is open."""
+        with _EXECUTORS_LOCK:
+            executor = _EXECUTORS.get(_executor_key(project_name, branch))
+        if executor is not None:
+            executor.close()
+
+
+    @atexit.register
+    def _close_executors():
+        for executor in list(_EXECUTORS.values()):
+            executor.close()
+
+
     class CloudExecutor:
         """
         Simulates sending the pipeline job to a Cloud-Agnostic target (REQ-013).
         """
-        def __init__(self, target: str, size: str):
+        def __init__(self, target: str, size: str, fast: Optional[bool] = None):
             self.target = target.lower()
             self.size = size.lower()
+            # Skip the simulated provisioning delays unless DEVLAKE_FAST=0 (or fast=False) is set.
+            self.fast = os.environ.get("DEVLAKE_FAST", "1") == "1" if fast is None else fast
 
             self.config = {
                 "aws": {"service": "AWS Glue/EMR", "time_multiplier": 0.5},
@@ -71,8 +199,11 @@
                 "gcp": {"service": "GCP Dataproc/Cloud Run", "time_multiplier": 0.45},
             }
 
-        def dispatch_job(self, pipeline_config: Dict[str, Any], data_size_gb: float):
-            """Mocks the deployment and execution process."""
+        def _dispatch_phases(self, pipeline_config: Dict[str, Any], data_size_gb: float):
+            """
+            Mocks the deployment and execution process. Yields after each phase that would wait
+            on the cloud provider; the generator's return value is the job's success flag.
+            """
             target_info = self.config.get(self.target)
             if not target_info:
                 print(f"❌ Error: Cloud target '{self.target}' is not supported yet.")
@@ -90,17 +221,39 @@
 
             setup_delay = random.uniform(5, 15)
             print(f"  [1/3] Setting up Cloud Environment... (Simulated {setup_delay:.1f}s delay)")
-            time.sleep(1)
+            yield
 
             print(f"  [2/3] Submitting pipeline to {target_info['service']}...")
             print("  Job ID: devlake-cloud-run-" + str(random.randint(1000, 9999)))
-            time.sleep(1)
+            yield
 
             print(f"  [3/3] Monitoring Execution...")
             print(f"  (Simulating {estimated_time_sec:.1f} seconds of processing...)")
-            time.sleep(1)
+            yield
 
             actual_runtime = estimated_time_min * random.uniform(0.9, 1.1)
             print(f"  Job Finished in **{actual_runtime:.2f} minutes**.")
             print(f"--- ✅ Cloud Job Complete: Data written to cloud storage. ---")
             return True
+
+        def dispatch_job(self, pipeline_config: Dict[str, Any], data_size_gb: float) -> bool:
+            """Runs the mocked job, blocking through the simulated provider waits."""
+            phases = self._dispatch_phases(pipeline_config, data_size_gb)
+            while True:
+                try:
+                    next(phases)
+                except StopIteration as done:
+                    return done.value
+                if not self.fast:
+                    time.sleep(1)
+
+        async def dispatch_job_async(self, pipeline_config: Dict[str, Any], data_size_gb: float) -> bool:
+            """Like dispatch_job(), but waits on the event loop so several jobs can be dispatched concurrently."""
+            phases = self._dispatch_phases(pipeline_config, data_size_gb)
+            while True:
+                try:
+                    next(phases)
+                except StopIteration as done:
+                    return done.value
+                if not self.fast:
+                    await asyncio.sleep(1)
@@ -1,12 +1,17 @@
 
+    import os
+    import copy
     import time
     import random
-    from pathlib import Path
     import polars as pl
-    from typing import Dict, Any
+    from typing import Dict, Any, Tuple
 
     from .devlake_pipeline import PipelineRunner, generate_pipeline_hash
-    from .devlake_executors import LocalExecutor, CloudExecutor
+    from .devlake_executors import LocalExecutor, CloudExecutor, get_local_executor
+
+    # Parsed pipeline config and hash per absolute path, tagged with the file's (mtime_ns, size)
+    # so an edit replaces the entry instead of adding another one.
+    _PIPELINE_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any], str]] = {}
 
 
     class HybridPipelineRunner(PipelineRunner):
@@ -14,14 +19,25 @@
         Extends PipelineRunner to support step-level execution targets (REQ-015).
         """
         def __init__(self, pipeline_path: str):
-            super().__init__(pipeline_path)
+            abs_path = os.path.abspath(pipeline_path)
+            st = os.stat(abs_path)
+            version = (st.st_mtime_ns, st.st_size)
+            cached = _PIPELINE_CACHE.get(abs_path)
+            if cached is None or cached[0] != version:
+                super().__init__(pipeline_path)
+                # The cache keeps its own copy, so changes a runner makes to its config stay local.
+                cached = (version, copy.deepcopy(self.pipeline_config), generate_pipeline_hash(self.pipeline_config))
+                _PIPELINE_CACHE[abs_path] = cached
+            else:
+                super().__init__(pipeline_path, pipeline_config=copy.deepcopy(cached[1]))
+            self.pipeline_hash = cached[2]
             self.local_executor = None
 
         def _get_executor(self, step_target: str, project_name: str, branch: str, size: str):
             """Returns the appropriate executor instance for the current step."""
             if step_target == 'local':
                 if self.local_executor is None:
-                    self.local_executor = LocalExecutor(data_dir=Path(project_name) / ".devlake/data", branch=branch)
+                    self.local_executor = get_local_executor(project_name, branch)
                 return self.local_executor
             else:
                 return CloudExecutor(target=step_target, size=size)
@@ -30,7 +46,7 @@
             """
             Executes pipeline steps, dynamically switching between local and cloud executors.
             """
-            data_hash = generate_pipeline_hash(self.pipeline_config)
+            data_hash = self.pipeline_hash
             print(f"Current Pipeline Hash: **{data_hash}**")
 
             print(f"
@@ -38,14 +54,16 @@
 
             last_df = None
 
-            for i, step_def in enumerate(self.pipeline_config['steps']):
-                step_name = list(step_def.keys())[0]
+            steps = []
+            for step_def in self.pipeline_config['steps']:
+                step_name = next(iter(step_def))
                 step_details = step_def[step_name]
+                steps.append((step_name, step_details.get('target', 'local').lower(), step_details))
+            total_steps = len(steps)
 
-                step_target = step_details.get('target', 'local').lower()
-
+            for i, (step_name, step_target, step_details) in enumerate(steps):
                 print(f"
-[{i+1}/{len(self.pipeline_config['steps'])}] **{step_name.upper()}** -> Target: **{step_target.upper()}**")
+[{i+1}/{total_steps}] **{step_name.upper()}** -> Target: **{step_target.upper()}**")
 
                 executor = self._get_executor(step_target, project_name, branch, size)
 
@@ -75,9 +93,6 @@
                     else:
                         print(f"  -> WARNING: Cloud target not fully supported for step type: {step_name} in mock hybrid runner.")
 
-            if self.local_executor:
-                self.local_executor.close()
-
             print("
 --- ✅ Hybrid Pipeline Execution Complete ---")
 
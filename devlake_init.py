@@ -4,6 +4,47 @@
     import yaml
     from textwrap import dedent
 
+    try:
+        from yaml import CSafeDumper as _YamlDumper
+    except ImportError:  # libyaml bindings are optional
+        from yaml import SafeDumper as _YamlDumper
+
+    # Static templates are dedented and encoded once at import.
+    _GITIGNORE_BYTES = dedent("""
+        # DevLake Local State (REQ-003)
+        .devlake/
+
+        # Python
+        __pycache__/
+        *.pyc
+
+        # Output
+        /data/
+        /output/
+    """).encode('utf-8')
+
+    _SAMPLE_PIPELINE_BYTES = dedent("""
+        # examples/quickstart/pipeline.yaml
+        name: quickstart
+        version: 1
+        triggers:
+          - schedule: "manual"
+        steps:
+          - load:
+              csv: "https://raw.githubusercontent.com/datasets/airport-codes/master/data/airport-codes.csv"
+              alias: airports
+
+          - transform:
+              sql: "SELECT iso_country, COUNT(*) as airport_count FROM airports GROUP BY iso_country ORDER BY 2 DESC"
+              output_alias: country_counts
+
+          - save:
+              parquet: "./output/country_counts.parquet"
+        tests:
+          - assert_no_null: iso_country
+    """).encode('utf-8')
+
+
     def run_init(project_name: str):
         """Implements the logic for `devlake init <project_name>` (REQ-003)."""
         print(f"Initializing DevLake project: **{project_name}**")
@@ -27,7 +68,7 @@
 
         # Create subdirectories
         for d in structure:
-            Path(d).mkdir(parents=True, exist_ok=True)
+            os.makedirs(d, exist_ok=True)
 
         # 3. Generate devlake.yaml (Project Config)
         config_content = {
@@ -37,46 +78,13 @@
             'local_storage': '.devlake/data',
         }
         with open("devlake.yaml", "w") as f:
-            yaml.dump(config_content, f, sort_keys=False)
+            yaml.dump(config_content, f, Dumper=_YamlDumper, sort_keys=False)
 
         # 4. Create .gitignore
-        gitignore_content = dedent("""
-            # DevLake Local State (REQ-003)
-            .devlake/
-
-            # Python
-            __pycache__/
-            *.pyc
-
-            # Output
-            /data/
-            /output/
-        """)
-        with open(".gitignore", "w") as f:
-            f.write(gitignore_content)
+        Path(".gitignore").write_bytes(_GITIGNORE_BYTES)
 
         # 5. Create a sample pipeline YAML (REQ-003, REQ-004)
-        sample_pipeline_content = dedent("""
-            # examples/quickstart/pipeline.yaml
-            name: quickstart
-            version: 1
-            triggers:
-              - schedule: "manual"
-            steps:
-              - load:
-                  csv: "https://raw.githubusercontent.com/datasets/airport-codes/master/data/airport-codes.csv"
-                  alias: airports
-
-              - transform:
-                  sql: "SELECT iso_country, COUNT(*) as airport_count FROM airports GROUP BY iso_country ORDER BY 2 DESC"
-                  output_alias: country_counts
-
-              - save:
-                  parquet: "./output/country_counts.parquet"
-            tests:
-              - assert_no_null: iso_country
-        """)
-        Path("pipelines/quickstart.yaml").write_text(sample_pipeline_content)
+        Path("pipelines/quickstart.yaml").write_bytes(_SAMPLE_PIPELINE_BYTES)
 
         print("
 ✅ Project structure created:")
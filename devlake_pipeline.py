@@ -1,58 +1,397 @@
 
 import os
+import sys
+import logging
+import asyncio
 import requests
 from pathlib import Path
 import yaml
 import polars as pl
-from typing import Union, Dict, Any, List
+from typing import Union, Dict, Any, List, Callable, Optional, Set, Tuple
 from textwrap import dedent
+from types import CodeType
 import hashlib
+import base64
 import json
 import shutil
+from urllib.parse import urlsplit
 import time
 import random
+import gzip
+import bz2
+from concurrent.futures import Future, ThreadPoolExecutor
 
-from .devlake_executors import LocalExecutor, CloudExecutor
+try:
+    import msgpack
+except ImportError:  # Optional; without it pipeline YAML is parsed on every load.
+    msgpack = None
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # libyaml bindings are optional
+    from yaml import SafeLoader as _YamlLoader
 
-def run_tests(df: pl.DataFrame, tests: List[Dict[str, Any]]):
-    """Executes data quality assertions (REQ-010)."""
-    print("\n  -> Running Data Quality Tests...")
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib json module.
+    orjson = None
 
-    def assert_no_null(df: pl.DataFrame, column: str) -> bool:
-        return df[column].null_count() == 0
+try:
+    import zstandard
+except ImportError:  # Optional; only needed for .zst CSV sources.
+    zstandard = None
 
-    def assert_unique(df: pl.DataFrame, column: str) -> bool:
-        return len(df[column].unique()) == len(df)
+try:
+    import fcntl
+except ImportError:  # Not available on Windows; snapshots fall back to plain copies.
+    fcntl = None
 
-    test_results = True
+from .devlake_executors import LocalExecutor, CloudExecutor, get_local_executor, close_local_executor
+
+logger = logging.getLogger("devlake.pipeline")
+
+
+class _StdoutHandler(logging.Handler):
+    """
+    Writes records to the current sys.stdout, looked up per record so redirect_stdout and
+    output capture are honoured. Flushing is left to _flush_log rather than done per record.
+    """
+    terminator = "\n"
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            sys.stdout.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        with self.lock:
+            sys.stdout.flush()
+
+
+_log_handler: Optional[_StdoutHandler] = None
+
+_DOWNLOAD_CHUNK_BYTES = 1 << 20
+_PY_TRANSFORM_CACHE: Dict[str, CodeType] = {}
+_YAML_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "devlake" / "yaml"
+# Runs post-pipeline tests and snapshot copies off the caller's thread; both release the GIL in I/O and Polars.
+_BACKGROUND = ThreadPoolExecutor(max_workers=2, thread_name_prefix="devlake-post")
+# Byte cap for .devlake/cache: downloads, decompressed CSVs and step outputs.
+_CACHE_MAX_BYTES = 2 << 30
+# CSV loads larger than this are converted to Parquet before any downstream step reads them.
+_CSV_SPILL_THRESHOLD_MB = 512
+# ZSTD-3 is noticeably smaller than Snappy for little extra write time; large row groups amortize metadata.
+_PARQUET_WRITE_OPTIONS: Dict[str, Any] = {
+    "compression": "zstd",
+    "compression_level": 3,
+    "row_group_size": 500_000,
+    "statistics": True,
+}
+# Compressed CSV formats by file extension, and the `format:` spellings accepted for each.
+_CSV_COMPRESSION_EXTENSIONS = {".gz": "gzip", ".bz2": "bz2", ".zst": "zstd"}
+_CSV_FORMAT_ALIASES = {"gz": "gzip", "gzip": "gzip", "bz2": "bz2", "bzip2": "bz2", "zst": "zstd", "zstd": "zstd"}
+_FICLONE = 0x40049409  # Linux ioctl that shares extents copy-on-write (Btrfs, XFS with reflink).
+
+
+def _configure_logging():
+    """
+    Sends pipeline progress to stdout without a flush per message; output is flushed at
+    step boundaries (see _flush_log). The handler writes through sys.stdout rather than a
+    separate wrapper over sys.stdout.buffer, so it stays in order with executor prints.
+    """
+    global _log_handler
+    if _log_handler is not None:
+        return
+    _log_handler = _StdoutHandler()
+    _log_handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_log_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+def _flush_log():
+    """Writes out pipeline messages buffered since the last flush."""
+    if _log_handler is not None:
+        _log_handler.flush()
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parses JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serializes an object to JSON bytes (2-space indented if pretty), using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else None)
+    return json.dumps(obj, indent=2 if pretty else None).encode('utf-8')
+
+
+def _load_pipeline_yaml(pipeline_path: str) -> Dict[str, Any]:
+    """
+    Parses a pipeline YAML file. When msgpack is available, the parsed config is cached
+    under the user cache dir keyed by (path, mtime, size), so unchanged files skip YAML
+    parsing on later loads.
+    """
+    cache_path = None
+    if msgpack is not None:
+        st = os.stat(pipeline_path)
+        path_digest = hashlib.sha256(os.path.abspath(pipeline_path).encode('utf-8')).hexdigest()[:16]
+        cache_path = _YAML_CACHE_DIR / f"{path_digest}-{st.st_mtime_ns}-{st.st_size}.msgpack"
+        try:
+            return msgpack.unpackb(cache_path.read_bytes(), raw=False, strict_map_key=False)
+        except (OSError, ValueError):
+            pass
+
+    with open(pipeline_path, 'r') as f:
+        config = yaml.load(f, Loader=_YamlLoader)
+
+    if cache_path is not None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            for stale in cache_path.parent.glob(f"{path_digest}-*.msgpack"):
+                stale.unlink()
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(msgpack.packb(config, use_bin_type=True))
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            pass  # Best effort: configs msgpack can't represent (YAML dates, ints over 64 bits) are just re-parsed.
+    return config
+
+
+def _cached_download(url: str, cache_dir: Path) -> Path:
+    """Downloads a remote file once into the project cache and returns the local path."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    local_path = cache_dir / hashlib.sha256(url.encode('utf-8')).hexdigest()[:16]
+    if local_path.exists():
+        os.utime(local_path)  # Mark as recently used for eviction.
+        logger.info(f"  -> Using cached download: {local_path}")
+        return local_path
+
+    tmp_path = local_path.with_name(local_path.name + ".part")
+    with requests.get(url, stream=True, timeout=60) as response:
+        response.raise_for_status()
+        with open(tmp_path, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_BYTES):
+                f.write(chunk)
+    os.replace(tmp_path, local_path)
+    return local_path
+
+
+def _decompressed_csv(source: Path, compression: str, cache_dir: Path) -> Path:
+    """
+    Stream-decompresses a gzip/bz2/zstd CSV into the project cache and returns the plain
+    CSV path, so it can be scanned lazily. Reused while the source's size and mtime hold.
+    """
+    st = os.stat(source)
+    key = f"{os.path.abspath(source)}:{st.st_mtime_ns}:{st.st_size}"
+    local_path = cache_dir / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]}.csv"
+    if local_path.exists():
+        os.utime(local_path)  # Mark as recently used for eviction.
+        return local_path
+
+    if compression == "gzip":
+        opener = gzip.open
+    elif compression == "bz2":
+        opener = bz2.open
+    elif compression == "zstd":
+        if zstandard is None:
+            raise ImportError("Reading .zst CSV files requires the 'zstandard' package.")
+        opener = zstandard.open
+    else:
+        raise ValueError(f"Unsupported CSV compression: {compression}")
+
+    logger.info(f"  -> Decompressing {compression} CSV to: {local_path}")
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = local_path.with_name(local_path.name + ".part")
+    with opener(source, 'rb') as fsrc, open(tmp_path, 'wb') as fdst:
+        shutil.copyfileobj(fsrc, fdst, _DOWNLOAD_CHUNK_BYTES)
+    os.replace(tmp_path, local_path)
+    return local_path
+
+
+def run_tests(df: Union[pl.DataFrame, pl.LazyFrame], tests: List[Dict[str, Any]]):
+    """Executes data quality assertions (REQ-010) in a single scan of the data."""
+    _configure_logging()
+    logger.info("\n  -> Running Data Quality Tests...")
+
+    exprs = []
+    checks = []
     for test in tests:
-        test_type = list(test.keys())[0]
-        test_value = list(test.values())[0]
+        ((test_type, col),) = test.items()
 
         if test_type == 'assert_no_null':
-            col = test_value
-            result = assert_no_null(df, col)
-            status = "PASS" if result else "FAIL"
-            print(f"    [{status}] assert_no_null on column '{col}'.")
-            if not result: test_results = False
-
+            expr = pl.col(col).null_count() == 0
         elif test_type == 'assert_unique':
-            col = test_value
-            result = assert_unique(df, col)
-            status = "PASS" if result else "FAIL"
-            print(f"    [{status}] assert_unique on column '{col}'.")
-            if not result: test_results = False
+            expr = pl.col(col).n_unique() == pl.len()
+        else:
+            continue
 
+        alias = f"{len(exprs)}__{test_type}"
+        exprs.append(expr.alias(alias))
+        checks.append((alias, test_type, col))
+
+    if not exprs:
+        return True
+
+    # All assertions are evaluated together so Polars scans each column once.
+    results = df.lazy().select(exprs).collect(engine="streaming").row(0, named=True)
+
+    test_results = True
+    for alias, test_type, col in checks:
+        result = results[alias]
+        status = "PASS" if result else "FAIL"
+        logger.info(f"    [{status}] {test_type} on column '{col}'.")
+        if not result: test_results = False
+
+    _flush_log()
     return test_results
 
 
+def _feed(h, value: Any):
+    """Feeds a canonical, type-tagged encoding of a parsed YAML value into a hasher."""
+    if isinstance(value, dict):
+        h.update(b"{")
+        for key in sorted(value, key=str):
+            _feed(h, key)
+            _feed(h, value[key])
+        h.update(b"}")
+    elif isinstance(value, (list, tuple)):
+        h.update(b"[")
+        for item in value:
+            _feed(h, item)
+        h.update(b"]")
+    else:
+        data = str(value).encode('utf-8')
+        # Length-prefix scalars so adjacent values can never run together ambiguously.
+        h.update(f"{type(value).__name__}:{len(data)}:".encode('ascii'))
+        h.update(data)
+
+
 def generate_pipeline_hash(pipeline_config: Dict[str, Any]) -> str:
     """Generates a hash based on pipeline configuration for data versioning (REQ-006)."""
-    config_to_hash = pipeline_config.copy()
-    config_to_hash.pop('triggers', None)
-    config_json = json.dumps(config_to_hash, sort_keys=True, indent=None)
-    return hashlib.sha256(config_json.encode('utf-8')).hexdigest()[:8]
+    # Always SHA-256: the ID names snapshots and benchmark history, so it must not vary with installed packages.
+    h = hashlib.sha256()
+    h.update(b"{")
+    for key in sorted(pipeline_config):
+        if key == 'triggers':  # Scheduling does not change the data a pipeline produces.
+            continue
+        _feed(h, key)
+        _feed(h, pipeline_config[key])
+    h.update(b"}")
+    # 48 bits as 10 lowercase base32 characters; an 8-char hex prefix held only 32 bits.
+    return base64.b32encode(h.digest()[:6]).rstrip(b'=').decode('ascii').lower()
+
+
+def _compile_python_transform(python_code: str) -> Callable[[Any, pl.LazyFrame], Any]:
+    """
+    Compiles a `transform.python` snippet once and returns a function of (pl, df) that runs
+    it in a fresh namespace and returns the snippet's `transformed_df`. The snippet is compiled
+    as written, so string literals in it are left untouched; code objects are cached by a
+    digest of the source.
+    """
+    key = hashlib.blake2b(python_code.encode('utf-8'), digest_size=16).hexdigest()
+    code = _PY_TRANSFORM_CACHE.get(key)
+    if code is None:
+        code = _PY_TRANSFORM_CACHE[key] = compile(python_code, f"<step:{key}>", "exec")
+
+    def _run(pl_module: Any, df: pl.LazyFrame) -> Any:
+        namespace: Dict[str, Any] = {"pl": pl_module, "df": df}
+        exec(code, namespace)
+        return namespace.get("transformed_df")
+    return _run
+
+
+def _step_hash(step_def: Dict[str, Any], upstream_hash: str) -> str:
+    """
+    Content-addresses a step by its definition and the hash of the step before it, so a
+    change anywhere upstream invalidates every step after it. Local CSV sources also
+    contribute their size and mtime so edited input files are picked up.
+    """
+    h = hashlib.sha256(json.dumps(step_def, sort_keys=True, default=str).encode('utf-8'))
+    h.update(upstream_hash.encode('utf-8'))
+    source = step_def.get('load', {}).get('csv', '')
+    if source and os.path.exists(source):
+        st = os.stat(source)
+        h.update(f"{st.st_mtime_ns}:{st.st_size}".encode('utf-8'))
+    return h.hexdigest()[:16]
+
+
+def _evict_cache(cache_root: Path, max_bytes: int, keep: Set[str]):
+    """
+    Deletes the least recently used files in the project cache (downloads and decompressed
+    CSVs in cache_root, step outputs in cache_root/steps) until it fits in max_bytes.
+    Paths in keep (the current run's files, which its frames still scan) are never deleted,
+    though they still count towards the total. In-flight .part/.tmp files are ignored.
+    """
+    entries = []
+    for cache_dir in (cache_root, cache_root / "steps"):
+        if not cache_dir.exists():
+            continue
+        for entry in os.scandir(cache_dir):
+            if entry.is_file(follow_symlinks=False) and not entry.name.endswith((".part", ".tmp")):
+                st = entry.stat()
+                entries.append((st.st_mtime, st.st_size, entry.path))
+
+    total = 0
+    for _, size, path in sorted(entries, reverse=True):
+        total += size
+        if total > max_bytes and path not in keep:
+            os.remove(path)
+
+
+def _clone_file(src: str, dst: str):
+    """
+    Copies a file, as a copy-on-write reflink when the filesystem supports it. Hardlinks
+    are deliberately not used: DuckDB and Parquet writers rewrite files in place, which
+    would silently change a hardlinked snapshot.
+    """
+    if fcntl is not None and sys.platform.startswith('linux'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+
+
+def _clone_tree(src: Path, dst: Path):
+    """
+    Recreates the directory tree at src under dst, cloning each file with _clone_file.
+    Directories are created up front; files are cloned concurrently since each copy
+    spends its time in syscalls that release the GIL.
+    """
+    files = []
+    stack = [(str(src), dst)]
+    while stack:
+        src_dir, dst_dir = stack.pop()
+        dst_dir.mkdir(parents=True, exist_ok=True)
+        for entry in os.scandir(src_dir):
+            target = dst_dir / entry.name
+            if entry.is_dir(follow_symlinks=False):
+                stack.append((entry.path, target))
+            else:
+                files.append((entry.path, str(target)))
+
+    if not files:
+        return
+    with ThreadPoolExecutor(max_workers=min(len(files), (os.cpu_count() or 1) * 2)) as pool:
+        for future in [pool.submit(_clone_file, s, d) for s, d in files]:
+            future.result()
+
+
+def _tree_manifest(root: Path) -> Dict[str, List[int]]:
+    """Maps each file under root (relative POSIX path) to its [size, mtime_ns]."""
+    manifest = {}
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            st = os.stat(os.path.join(dirpath, name))
+            rel_path = Path(dirpath, name).relative_to(root).as_posix()
+            manifest[rel_path] = [st.st_size, st.st_mtime_ns]
+    return manifest
 
 
 class PipelineRunner:
@@ -60,13 +399,19 @@ class PipelineRunner:
     Simulates the `devlake run` command, executing the pipeline steps,
     supporting local and cloud execution, branching, testing, and versioning.
     """
-    def __init__(self, pipeline_path: str):
+    def __init__(self, pipeline_path: str, pipeline_config: Optional[Dict[str, Any]] = None):
+        """pipeline_config may be passed when the caller already holds the parsed file."""
         self.pipeline_path = pipeline_path
         self.pipeline_config: Dict[str, Any] = {}
         self.last_output_alias: str = ""
+        # Parquet outputs (step cache entries and saves) keyed by destination; written together after the steps.
+        self._pending_sinks: Dict[Path, Tuple[pl.LazyFrame, bool]] = {}
+        self._last_cache_path: Optional[Path] = None
+        # Cache files written or reused by the current run; exempt from eviction.
+        self._run_cache_files: Set[str] = set()
+        self._pending: List[Future] = []
 
-        with open(pipeline_path, 'r') as f:
-            self.pipeline_config = yaml.safe_load(f)
+        self.pipeline_config = pipeline_config if pipeline_config is not None else _load_pipeline_yaml(pipeline_path)
 
         if not self.pipeline_config.get('steps'):
             raise ValueError("Pipeline file must contain a 'steps' section.")
@@ -74,111 +419,254 @@ class PipelineRunner:
     def checkout(self, project_name: str, branch: str, hash_id: str):
         """
         Simulates `devlake checkout <hash_id>` (REQ-006).
-        Swaps the current branch's data to point to the snapshot folder.
+        Swaps the current branch's data to point to the snapshot folder. hash_id is the
+        10-character base32 pipeline hash printed by `devlake run` (case-insensitive).
         """
-        version_path = Path(project_name) / ".devlake/versions" / hash_id
-        current_data_path = Path(project_name) / ".devlake/data" / branch
+        hash_id = hash_id.lower()
+        _configure_logging()
+        self._bind_paths(project_name, branch)
+        version_path = self._versions_root / hash_id
+        current_data_path = self._data_root
 
         if not version_path.exists():
-            print(f"❌ Error: Data version '{hash_id}' not found.")
+            logger.error(f"❌ Error: Data version '{hash_id}' not found.")
+            _flush_log()
             return
 
-        print(f"Checking out data version **{hash_id}**...")
+        logger.info(f"Checking out data version **{hash_id}**...")
 
+        # The branch's shared DuckDB connection still points at the files being replaced.
+        close_local_executor(project_name, branch)
         if current_data_path.exists():
             shutil.rmtree(current_data_path)
 
-        shutil.copytree(version_path, current_data_path)
+        _clone_tree(version_path, current_data_path)
+
+        logger.info(f"✅ Branch '{branch}' now uses data from version '{hash_id}'.")
+        logger.info("Run `devlake console` to query the historical data.")
+        _flush_log()
 
-        print(f"✅ Branch '{branch}' now uses data from version '{hash_id}'.")
-        print("Run `devlake console` to query the historical data.")
+    def _bind_paths(self, project_name: str, branch: str):
+        """Resolves the project's .devlake locations once, for the helpers of a run or checkout."""
+        self._root = Path(project_name)
+        self._data_root = self._root / ".devlake/data" / branch
+        self._versions_root = self._root / ".devlake/versions"
+        self._cache_root = self._root / ".devlake/cache"
+        self._step_cache_root = self._cache_root / "steps"
 
-    def _execute_steps(self, project_name: str, executor: LocalExecutor):
+    def _execute_steps(self, executor: LocalExecutor):
         """Helper to execute the pipeline steps using the provided LocalExecutor."""
         last_df = None
-        for i, step_def in enumerate(self.pipeline_config['steps']):
-            step_name = list(step_def.keys())[0]
-            step_details = step_def[step_name]
-            print(f"\n[{i+1}/{len(self.pipeline_config['steps'])}] **{step_name.upper()}** Step...")
-
-            if step_name == 'load':
-                if 'csv' in step_details:
-                    url = step_details['csv']
-                    alias = step_details['alias']
-                    print(f"  -> Loading CSV from: {url}")
-                    df = pl.read_csv(url)
-                    executor.register_dataframe(alias, df)
-                    self.last_output_alias = alias
-                    last_df = df
-
-            elif step_name == 'transform':
-                if 'sql' in step_details:
-                    sql_query = step_details['sql']
-                    output_alias = step_details['output_alias']
-                    df_result = executor.query(sql_query)
-                    executor.register_dataframe(output_alias, df_result)
-                    self.last_output_alias = output_alias
-                    last_df = df_result
-
-                elif 'python' in step_details:
-                    python_code = step_details['python']
-                    output_alias = step_details.get('output_alias', self.last_output_alias + "_py_transformed")
-
-                    input_df = executor.data_store.get(self.last_output_alias)
-                    if input_df is None:
-                        print(f"  -> ERROR: Cannot run Python transform. No input data found for alias: {self.last_output_alias}")
-                        continue
-
-                    print(f"  -> Running Python Polars transformation on **{self.last_output_alias}**...")
-                    exec_context = {'pl': pl, 'df': input_df, 'transformed_df': None}
-                    try:
-                        exec(python_code, exec_context)
-                        df_result = exec_context.get('transformed_df')
-                        if isinstance(df_result, pl.DataFrame):
-                            executor.register_dataframe(output_alias, df_result)
-                            self.last_output_alias = output_alias
-                            last_df = df_result
-                        else:
-                            print("  -> ERROR: Python code did not produce a Polars DataFrame named 'transformed_df'.")
-                            continue
-                    except Exception as e:
-                        print(f"  -> ERROR during Python execution: {e}")
-                        continue
-
-            elif step_name == 'save':
-                output_path = Path(project_name) / step_details['parquet']
-                df_to_save = executor.data_store.get(self.last_output_alias)
-                if df_to_save is None:
-                    print(f"  -> ERROR: No data found to save for alias: {self.last_output_alias}")
-                    continue
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                df_to_save.write_parquet(output_path)
-                print(f"  -> Data saved to **Parquet** at: {output_path}")
-
-            else:
-                print(f"  -> WARNING: Unknown step type '{step_name}'. Skipping.")
+        upstream_hash = ""
+        self._pending_sinks = {}
+        self._last_cache_path = None
+        self._run_cache_files = set()
+        executor.reset_frames()
+        steps = self.pipeline_config['steps']
+        n_steps = len(steps)
+        for i, step_def in enumerate(steps):
+            _flush_log()
+            step_name = next(iter(step_def))
+            logger.info(f"\n[{i+1}/{n_steps}] **{step_name.upper()}** Step...")
+
+            df, upstream_hash = self._run_step(executor, step_def, upstream_hash)
+            if df is not None:
+                last_df = df
+
+        self._flush_sinks()
+        _flush_log()
+        if last_df is not None and self._last_cache_path is not None:
+            # Downstream consumers (tests) read the freshly written cache instead of re-running the plan.
+            last_df = pl.scan_parquet(self._last_cache_path)
+
+        _evict_cache(self._cache_root, _CACHE_MAX_BYTES, self._run_cache_files)
         return last_df
 
-    def _create_snapshot(self, project_name: str, branch: str, data_hash: str):
+    def _run_step(self, executor: LocalExecutor, step_def: Dict[str, Any], upstream_hash: str):
+        """
+        Runs a single step, reusing its cached output when neither the step nor anything
+        upstream of it has changed. Returns the step's LazyFrame (or None) and its hash,
+        which becomes the upstream hash of the next step.
+        """
+        step_name = next(iter(step_def))
+        step_details = step_def[step_name]
+        step_hash = _step_hash(step_def, upstream_hash)
+
+        if step_name == 'save':
+            self._save_step(executor, step_details)
+            return None, step_hash
+
+        cache_path = self._step_cache_root / f"{step_hash}.parquet"
+        output_alias = self._step_output_alias(step_name, step_details)
+        if output_alias and cache_path.exists():
+            os.utime(cache_path)  # Mark as recently used for eviction.
+            df = pl.scan_parquet(cache_path)
+            logger.info(f"  -> Step unchanged (cache {step_hash}). Reusing cached output.")
+        else:
+            df = self._compute_step(executor, step_name, step_details, cache_path)
+            if df is None:
+                return None, step_hash
+            # Downstream steps keep building on the lazy plan; the cache entry is written in _flush_sinks.
+            if not cache_path.exists():
+                self._pending_sinks[cache_path] = (df, False)
+
+        executor.register_dataframe(output_alias, df)
+        self.last_output_alias = output_alias
+        self._last_cache_path = cache_path
+        self._run_cache_files.add(str(cache_path))
+        return df, step_hash
+
+    def _step_output_alias(self, step_name: str, step_details: Dict[str, Any]) -> str:
+        """Returns the alias a load/transform step publishes its result under ('' if none)."""
+        if step_name == 'load':
+            if 'csv' in step_details:
+                return step_details['alias']
+        if step_name == 'transform':
+            if 'sql' in step_details:
+                return step_details['output_alias']
+            if 'python' in step_details:
+                return step_details.get('output_alias', self.last_output_alias + "_py_transformed")
+        return ''
+
+    def _compute_step(self, executor: LocalExecutor, step_name: str, step_details: Dict[str, Any], cache_path: Path):
+        """
+        Builds the LazyFrame for a load or transform step, or returns None if the step produced
+        nothing. Loads over `size_threshold_mb` are written to cache_path immediately.
+        """
+        if step_name == 'load':
+            if 'csv' in step_details:
+                url = step_details['csv']
+                logger.info(f"  -> Loading CSV from: {url}")
+                source = url
+                if url.startswith(('http://', 'https://')):
+                    source = _cached_download(url, self._cache_root)
+                    self._run_cache_files.add(str(source))
+                # `format:` overrides detection from the URL's extension, e.g. for extensionless URLs.
+                fmt = str(step_details.get('format', '')).lower().lstrip('.')
+                if fmt:
+                    compression = None if fmt == 'csv' else _CSV_FORMAT_ALIASES.get(fmt, fmt)
+                else:
+                    # Only the path counts, so query strings like `?token=...` don't hide the extension.
+                    path = urlsplit(url).path if '://' in url else url
+                    compression = _CSV_COMPRESSION_EXTENSIONS.get(os.path.splitext(path)[1].lower())
+                if compression:
+                    source = _decompressed_csv(source, compression, self._cache_root)
+                    self._run_cache_files.add(str(source))
+                lf = pl.scan_csv(source, low_memory=True)
+
+                threshold_mb = step_details.get('size_threshold_mb', _CSV_SPILL_THRESHOLD_MB)
+                # Globs and object-store URLs are left to scan_csv; only a single local file is measured.
+                if os.path.isfile(source) and os.path.getsize(source) > threshold_mb * (1 << 20):
+                    # Stream the CSV into Parquet once, so every later step scans Parquet rather than re-parsing CSV.
+                    logger.info(f"  -> CSV exceeds {threshold_mb} MB; converting to Parquet at: {cache_path}")
+                    cache_path.parent.mkdir(parents=True, exist_ok=True)
+                    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+                    lf.sink_parquet(tmp_path, **_PARQUET_WRITE_OPTIONS)
+                    os.replace(tmp_path, cache_path)
+                    return pl.scan_parquet(cache_path)
+                return lf
+
+        elif step_name == 'transform':
+            if 'sql' in step_details:
+                return executor.query_lazy(step_details['sql'])
+
+            elif 'python' in step_details:
+                python_code = step_details['python']
+
+                input_df = executor.data_store.get(self.last_output_alias)
+                if input_df is None:
+                    logger.error(f"  -> ERROR: Cannot run Python transform. No input data found for alias: {self.last_output_alias}")
+                    return None
+
+                logger.info(f"  -> Running Python Polars transformation on **{self.last_output_alias}**...")
+                try:
+                    df_result = _compile_python_transform(python_code)(pl, input_df)
+                    if isinstance(df_result, pl.DataFrame):
+                        df_result = df_result.lazy()
+                    if isinstance(df_result, pl.LazyFrame):
+                        return df_result
+                    logger.error("  -> ERROR: Python code did not produce a Polars DataFrame or LazyFrame named 'transformed_df'.")
+                except Exception as e:
+                    logger.error(f"  -> ERROR during Python execution: {e}")
+                return None
+
+        else:
+            logger.warning(f"  -> WARNING: Unknown step type '{step_name}'. Skipping.")
+        return None
+
+    def _save_step(self, executor: LocalExecutor, step_details: Dict[str, Any]):
+        """Writes the most recent step output to the configured Parquet path."""
+        output_path = self._root / step_details['parquet']
+        df_to_save = executor.data_store.get(self.last_output_alias)
+        if df_to_save is None:
+            logger.error(f"  -> ERROR: No data found to save for alias: {self.last_output_alias}")
+            return
+        self._pending_sinks[output_path] = (df_to_save, True)
+        logger.info(f"  -> Queued Parquet write to: {output_path}")
+
+    def _flush_sinks(self):
+        """
+        Writes every queued Parquet output in one multi-sink Polars plan, so independent
+        branches run in parallel and shared upstream work is computed once.
+        """
+        if not self._pending_sinks:
+            return
+        # A top-level `parquet:` mapping in the pipeline YAML overrides the writer options for saved outputs.
+        save_options = {**_PARQUET_WRITE_OPTIONS, **self.pipeline_config.get('parquet', {})}
+        sinks = []
+        try:
+            for path, (df, is_save) in self._pending_sinks.items():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_name(path.name + ".tmp")
+                options = save_options if is_save else _PARQUET_WRITE_OPTIONS
+                sinks.append(df.sink_parquet(tmp_path, lazy=True, **options))
+            pl.collect_all(sinks, engine="streaming")
+        except Exception:
+            # Nothing is published from a failed plan; don't leave partial files next to the outputs.
+            for path in self._pending_sinks:
+                path.with_name(path.name + ".tmp").unlink(missing_ok=True)
+            self._pending_sinks = {}
+            raise
+
+        for path, (_, is_save) in self._pending_sinks.items():
+            os.replace(path.with_name(path.name + ".tmp"), path)
+            if is_save:
+                logger.info(f"  -> Data saved to **Parquet** at: {path}")
+        self._pending_sinks = {}
+
+    def _create_snapshot(self, current_data_path: Path, versions_root: Path, data_hash: str):
         """Creates a data snapshot of the current branch's data."""
-        current_data_path = Path(project_name) / ".devlake/data" / branch
-        snapshot_path = Path(project_name) / ".devlake/versions" / data_hash
+        snapshot_path = versions_root / data_hash
+        manifest_path = snapshot_path.with_name(f"{data_hash}.manifest.json")
+
+        # A snapshot whose files no longer match its recorded manifest has been altered; rebuild it.
+        if snapshot_path.exists() and manifest_path.exists():
+            if _json_loads(manifest_path.read_bytes()) != _tree_manifest(snapshot_path):
+                logger.info(f"\n📸 Snapshot for version **{data_hash}** does not match its manifest. Rebuilding.")
+                shutil.rmtree(snapshot_path)
 
         if not snapshot_path.exists():
-            print(f"\n📸 Creating data snapshot for version **{data_hash}**...")
+            logger.info(f"\n📸 Creating data snapshot for version **{data_hash}**...")
             snapshot_path.parent.mkdir(parents=True, exist_ok=True)
             if current_data_path.exists():
-                shutil.copytree(current_data_path, snapshot_path)
-                print("Snapshot created successfully. Use `devlake checkout` to revert.")
+                # Clone into a staging directory and rename, so a crash never leaves a partial snapshot.
+                staging_path = snapshot_path.with_name(f"{data_hash}.tmp")
+                if staging_path.exists():
+                    shutil.rmtree(staging_path)
+                _clone_tree(current_data_path, staging_path)
+                os.replace(staging_path, snapshot_path)
+                manifest_path.write_bytes(_json_dumps(_tree_manifest(snapshot_path)))
+                logger.info("Snapshot created successfully. Use `devlake checkout` to revert.")
             else:
-                print(f"  -> WARNING: No local data found at {current_data_path} to snapshot.")
+                logger.warning(f"  -> WARNING: No local data found at {current_data_path} to snapshot.")
         else:
-            print(f"\n📸 Snapshot for version **{data_hash}** already exists. Skipping creation.")
+            logger.info(f"\n📸 Snapshot for version **{data_hash}** already exists. Skipping creation.")
+        _flush_log()
 
 
-    def _mock_cloud_snapshot(self, project_name: str, data_hash: str, target: str):
+    def _mock_cloud_snapshot(self, versions_root: Path, data_hash: str, target: str):
         """Mocks snapshotting cloud results by recording metadata."""
-        snapshot_path = Path(project_name) / ".devlake/versions" / data_hash
+        snapshot_path = versions_root / data_hash
         snapshot_path.mkdir(parents=True, exist_ok=True)
 
         metadata = {
@@ -188,41 +676,124 @@ class PipelineRunner:
             "output_uri": f"s3://devlake-output/{data_hash}/" if target == "aws" else f"gs://devlake-output/{data_hash}/"
         }
 
-        with open(snapshot_path / "metadata.json", "w") as f:
-            json.dump(metadata, f, indent=2)
+        (snapshot_path / "metadata.json").write_bytes(_json_dumps(metadata, pretty=True))
 
-        print(f"📸 Cloud snapshot metadata recorded for version **{data_hash}**.")
+        logger.info(f"📸 Cloud snapshot metadata recorded for version **{data_hash}**.")
+
+    def _post_run(self, df: Optional[pl.LazyFrame], tests: List[Dict[str, Any]],
+                  current_data_path: Path, versions_root: Path, data_hash: str):
+        """
+        Runs the data quality tests, then the snapshot, as one background job so their output
+        keeps that order. The snapshot is taken even if the tests raise.
+        """
+        try:
+            if tests:
+                self._report_tests(df, tests)
+        finally:
+            self._create_snapshot(current_data_path, versions_root, data_hash)
+
+    def _report_tests(self, df: pl.LazyFrame, tests: List[Dict[str, Any]]) -> bool:
+        """Runs the pipeline's data quality tests and prints the overall verdict."""
+        # Assertions run on the lazy plan; projection pushdown reads only the tested columns.
+        passed = run_tests(df, tests)
+        if passed:
+            logger.info("\n✅ Data Quality Tests Passed for pipeline output.")
+        else:
+            logger.info("\n❌ Data Quality Tests Failed. Pipeline output may be unreliable.")
+        _flush_log()
+        return passed
+
+    def _submit_background(self, task: str, fn: Callable[..., Any], *args: Any):
+        """Queues fn on the background pool; a failure is logged as soon as it happens, not only on wait()."""
+        def _log_failure(future: Future):
+            exc = future.exception()
+            if exc is not None:
+                logger.error(f"  -> ERROR: Background {task} failed: {type(exc).__name__}: {exc}")
+                _flush_log()
+
+        future = _BACKGROUND.submit(fn, *args)
+        future.add_done_callback(_log_failure)
+        self._pending.append(future)
+
+    def wait(self):
+        """
+        Blocks until all background tests and snapshots not yet waited on have finished, then
+        re-raises the first failure among them.
+        """
+        pending, self._pending = self._pending, []
+        first_error = None
+        for future in pending:
+            exc = future.exception()
+            if first_error is None:
+                first_error = exc
+        if first_error is not None:
+            raise first_error
 
     def run(self, project_name: str, branch: str = "main",
-            target: str = "local", size: str = "medium", data_size_gb: float = 1.0):
+            target: str = "local", size: str = "medium", data_size_gb: float = 1.0,
+            wait: bool = True):
         """
         Executes the pipeline either locally or on a cloud target (REQ-013).
+        With wait=False a local run returns once the steps are written, leaving the tests and
+        snapshot running in the background; call wait() to collect them.
         """
+        _configure_logging()
         data_hash = generate_pipeline_hash(self.pipeline_config)
-        print(f"Current Pipeline Hash (Data Version ID): **{data_hash}**")
+        logger.info(f"Current Pipeline Hash (Data Version ID): **{data_hash}**")
+        self._bind_paths(project_name, branch)
 
         if target == "local":
-            executor = LocalExecutor(data_dir=Path(project_name) / ".devlake/data", branch=branch)
-            print(f"\n--- Running Pipeline: {self.pipeline_config['name']} (Target: LOCAL) ---")
-
-            last_df = self._execute_steps(project_name, executor)
-
-            tests = self.pipeline_config.get('tests', [])
-            if last_df is not None and tests:
-                if run_tests(last_df, tests):
-                    print("\n✅ Data Quality Tests Passed for pipeline output.")
-                else:
-                    print("\n❌ Data Quality Tests Failed. Pipeline output may be unreliable.")
-
-            self._create_snapshot(project_name, branch, data_hash)
-            executor.close()
+            executor = get_local_executor(project_name, branch)
+            logger.info(f"\n--- Running Pipeline: {self.pipeline_config['name']} (Target: LOCAL) ---")
+
+            with executor.run_lock:
+                last_df = self._execute_steps(executor)
+
+            # Tests and the snapshot copy don't change the pipeline output, so they run in the background.
+            tests = self.pipeline_config.get('tests', []) if last_df is not None else []
+            # Paths are passed explicitly since a later run() may rebind them while this is in flight.
+            self._submit_background("tests and snapshot", self._post_run,
+                                    last_df, tests, self._data_root, self._versions_root, data_hash)
+            if not wait:
+                logger.info("\n--- Pipeline Steps Complete (tests and snapshot continue in the background) ---")
+                _flush_log()
+                return
+            self.wait()
 
         else: # Cloud execution
             cloud_executor = CloudExecutor(target=target, size=size)
             success = cloud_executor.dispatch_job(self.pipeline_config, data_size_gb)
+            self._finish_cloud_run(success, data_hash, target)
+
+        logger.info("\n--- Pipeline Execution Complete ---")
+        _flush_log()
+
+    async def run_async(self, project_name: str, branch: str = "main",
+                        target: str = "local", size: str = "medium", data_size_gb: float = 1.0):
+        """
+        Awaitable run(). Cloud jobs wait on the event loop, so several can be dispatched
+        together with asyncio.gather. Local runs execute run() on a worker thread, but the
+        steps of local runs for the same project and branch still take turns, since those
+        runs share one executor and its table aliases.
+        """
+        if target == "local":
+            await asyncio.to_thread(self.run, project_name, branch, target, size, data_size_gb)
+            return
+
+        _configure_logging()
+        data_hash = generate_pipeline_hash(self.pipeline_config)
+        logger.info(f"Current Pipeline Hash (Data Version ID): **{data_hash}**")
+        self._bind_paths(project_name, branch)
+
+        cloud_executor = CloudExecutor(target=target, size=size)
+        success = await cloud_executor.dispatch_job_async(self.pipeline_config, data_size_gb)
+        self._finish_cloud_run(success, data_hash, target)
 
-            if success:
-                print(f"--- Cloud execution simulated successfully. ---")
-                self._mock_cloud_snapshot(project_name, data_hash, target)
+        logger.info("\n--- Pipeline Execution Complete ---")
+        _flush_log()
 
-        print("\n--- Pipeline Execution Complete ---")
+    def _finish_cloud_run(self, success: bool, data_hash: str, target: str):
+        """Records the snapshot metadata for a cloud job that completed."""
+        if success:
+            logger.info("--- Cloud execution simulated successfully. ---")
+            self._mock_cloud_snapshot(self._versions_root, data_hash, target)